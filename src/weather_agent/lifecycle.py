@@ -4,9 +4,14 @@ Lifecycle functions for the Weather Agent.
 
 from typing import Any
 import asyncio
+import concurrent.futures
 from pydantic import BaseModel, Field, SecretStr
 from solace_ai_connector.common.log import log
-from .services.weather_service import WeatherService
+from .services.weather_service import CLOSE_INFLIGHT_TIMEOUT, WeatherService
+
+# Upper bound on blocking for cleanup handed to another thread's loop:
+# the in-flight wait plus a margin for closing the HTTP session
+CLEANUP_TIMEOUT = CLOSE_INFLIGHT_TIMEOUT + 10
 
 
 class WeatherAgentInitConfig(BaseModel):
@@ -18,12 +23,32 @@ class WeatherAgentInitConfig(BaseModel):
         default="https://api.openweathermap.org/data/2.5",
         description="Weather API base URL"
     )
+    use_uvloop: bool = Field(
+        default=False,
+        description="Use uvloop for new event loops if installed (Linux/macOS only)"
+    )
     startup_message: str = Field(
         default="Weather Agent is ready to provide weather information!",
         description="Message to log on startup"
     )
 
 
+def _install_uvloop(log_identifier: str) -> None:
+    """Switch new event loops to uvloop when available and the host hasn't chosen a policy."""
+    try:
+        import uvloop
+    except ImportError:
+        log.info(f"{log_identifier} uvloop not installed, using the default asyncio event loop")
+        return
+    
+    if type(asyncio.get_event_loop_policy()) is not asyncio.DefaultEventLoopPolicy:
+        log.info(f"{log_identifier} Custom event loop policy already set, leaving it in place")
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    log.info(f"{log_identifier} Installed uvloop event loop policy")
+
+
 def initialize_weather_agent(host_component: Any, init_config: WeatherAgentInitConfig):
     """
     Initialize the Weather Agent with weather service.
@@ -36,6 +61,9 @@ def initialize_weather_agent(host_component: Any, init_config: WeatherAgentInitC
     log.info(f"{log_identifier} Starting Weather Agent initialization...")
     
     try:
+        if init_config.use_uvloop:
+            _install_uvloop(log_identifier)
+        
         # Initialize weather service
         weather_service = WeatherService(
             api_key=init_config.api_key.get_secret_value(),
@@ -63,19 +91,29 @@ def cleanup_weather_agent(host_component: Any):
     """
     Clean up Weather Agent resources.
     
+    Cleanup runs on the event loop that owns the weather service's HTTP session,
+    since aiohttp sessions can only be closed on their own loop. When called from
+    inside a running loop the cleanup is scheduled and returned so the host can
+    await it.
+    
     Args:
         host_component: The agent host component
     """
     log_identifier = f"[{host_component.agent_name}:cleanup]"
     log.info(f"{log_identifier} Starting Weather Agent cleanup...")
 
-    async def cleanup_async(host_component: Any):
+    async def cleanup_async(host_component: Any, close_service: bool = True):
         try:
             # Get and close weather service
             weather_service = host_component.get_agent_specific_state("weather_service")
             if weather_service:
-                await weather_service.close()
-                log.info(f"{log_identifier} Weather service closed successfully")
+                # Flush the request count kept on the service during its lifetime
+                host_component.set_agent_specific_state(
+                    "weather_requests_count", weather_service.request_count
+                )
+                if close_service:
+                    await weather_service.close()
+                    log.info(f"{log_identifier} Weather service closed successfully")
             
             # Log final statistics
             request_count = host_component.get_agent_specific_state("weather_requests_count", 0)
@@ -86,7 +124,38 @@ def cleanup_weather_agent(host_component: Any):
         except Exception as e:
             log.error(f"{log_identifier} Error during cleanup: {e}")
     
-    # run cleanup in the event loop
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(cleanup_async(host_component))
-    log.info(f"{log_identifier} Weather Agent cleanup completed successfully")
\ No newline at end of file
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        running_loop = None
+    
+    weather_service = host_component.get_agent_specific_state("weather_service")
+    session_loop = getattr(weather_service, "session_loop", None)
+    if session_loop is not None and session_loop.is_closed():
+        session_loop = None
+    
+    if session_loop is not None and session_loop is not running_loop and session_loop.is_running():
+        # The session's loop is running in another thread: hand the cleanup over to it
+        log.info(f"{log_identifier} Scheduling cleanup on the HTTP session's event loop")
+        future = asyncio.run_coroutine_threadsafe(cleanup_async(host_component), session_loop)
+        if running_loop is not None:
+            return asyncio.wrap_future(future)
+        try:
+            future.result(timeout=CLEANUP_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            log.error(f"{log_identifier} Timed out after {CLEANUP_TIMEOUT}s waiting for cleanup on the session's event loop")
+            return
+    elif running_loop is not None:
+        # Already inside the host's loop: blocking here would deadlock, so schedule instead
+        if session_loop is not None and session_loop is not running_loop:
+            # The session belongs to another, stopped loop and can't be closed from this one
+            log.warning(f"{log_identifier} HTTP session belongs to a stopped event loop, skipping its close")
+            return running_loop.create_task(cleanup_async(host_component, close_service=False))
+        log.info(f"{log_identifier} Event loop is running, scheduling cleanup on it")
+        return running_loop.create_task(cleanup_async(host_component))
+    elif session_loop is not None:
+        session_loop.run_until_complete(cleanup_async(host_component))
+    else:
+        asyncio.run(cleanup_async(host_component))
+    log.info(f"{log_identifier} Weather Agent cleanup completed successfully")
@@ -0,0 +1,68 @@
+"""
+Typed models for OpenWeatherMap API responses.
+
+Only the fields the weather service reads are declared; msgspec ignores the rest.
+Display-only numbers accept int or float so values pass through as the API sent them.
+"""
+
+from typing import List, Optional, Union
+import msgspec
+
+
+class Main(msgspec.Struct):
+    """Temperature, humidity and pressure readings."""
+    temp: Union[int, float]
+    feels_like: Union[int, float]
+    humidity: Union[int, float]
+    pressure: Union[int, float]
+
+
+class Weather(msgspec.Struct):
+    """Weather condition description."""
+    description: str
+
+
+class Wind(msgspec.Struct):
+    """Wind speed and direction."""
+    speed: Union[int, float] = 0
+    deg: Union[int, float] = 0
+
+
+class Sys(msgspec.Struct):
+    """Country and sun times for current weather."""
+    country: str
+    sunrise: int
+    sunset: int
+
+
+class CurrentWeatherResponse(msgspec.Struct):
+    """Response from the /weather endpoint."""
+    name: str
+    dt: int
+    main: Main
+    sys: Sys
+    weather: List[Weather]
+    wind: Optional[Wind] = None
+    visibility: Union[int, float] = 0
+
+
+class ForecastItem(msgspec.Struct):
+    """A single 3-hour entry from the /forecast endpoint."""
+    dt: int
+    main: Main
+    weather: List[Weather]
+    wind: Optional[Wind] = None
+    pop: Union[int, float] = 0
+
+
+class City(msgspec.Struct):
+    """Forecast location, with its UTC offset in seconds."""
+    name: str
+    country: str
+    timezone: int = 0
+
+
+class ForecastResponse(msgspec.Struct):
+    """Response from the /forecast endpoint."""
+    city: City
+    items: List[ForecastItem] = msgspec.field(name="list")
@@ -2,10 +2,50 @@
 Weather service for interacting with external weather APIs.
 """
 
+import asyncio
+import math
+import random
+import socket
+import time
 import aiohttp
-from typing import Dict, Any, Optional, List
+import msgspec
+import orjson
+from collections import OrderedDict
+from itertools import groupby
+from typing import Dict, Any, Optional, Iterable, Tuple, Callable, Awaitable
 from datetime import datetime, timezone
 from solace_ai_connector.common.log import log
+from .weather_models import CurrentWeatherResponse, ForecastItem, ForecastResponse
+
+try:
+    import aiodns  # noqa: F401  # enables aiohttp.AsyncResolver
+    HAS_AIODNS = True
+except ImportError:
+    HAS_AIODNS = False
+
+SECONDS_PER_DAY = 86400
+
+# Response cache tuning (seconds / entries)
+CURRENT_WEATHER_TTL = 60
+FORECAST_TTL = 600
+CACHE_MAX_ENTRIES = 512
+
+# HTTP connection pool tuning
+CONNECTION_LIMIT = 64
+CONNECTION_LIMIT_PER_HOST = 16
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 75
+
+# Seconds close() waits for in-flight fetches before closing the session
+CLOSE_INFLIGHT_TIMEOUT = 5
+
+
+def _copy_response(value: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a formatted response, including its lists of per-day dicts."""
+    return {
+        k: [dict(item) for item in v] if isinstance(v, list) else v
+        for k, v in value.items()
+    }
 
 
 class WeatherService:
@@ -14,21 +54,142 @@ class WeatherService:
     def __init__(self, api_key: str, base_url: str = "https://api.openweathermap.org/data/2.5"):
         self.api_key = api_key
         self.base_url = base_url
+        self._weather_url = f"{base_url}/weather"
+        self._forecast_url = f"{base_url}/forecast"
+        self._weather_decoder = msgspec.json.Decoder(CurrentWeatherResponse)
+        self._forecast_decoder = msgspec.json.Decoder(ForecastResponse)
         self.session: Optional[aiohttp.ClientSession] = None
+        self._session_lock = asyncio.Lock()
+        # Loop the session (and its pooled connections) belongs to; close() must run on it
+        self.session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timeout = aiohttp.ClientTimeout(total=10, connect=3)
         self.log_identifier = "[WeatherService]"
+        # Served-request counter, flushed to agent state on cleanup rather than per call
+        self.request_count = 0
+        # key -> (expires_at, formatted response), kept in LRU order
+        self._cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # key -> task running the single in-flight fetch for that key
+        self._inflight: Dict[Tuple, "asyncio.Task[Dict[str, Any]]"] = {}
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create an HTTP session."""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
-        return self.session
+        """Get or create an HTTP session backed by a pooled keep-alive connector."""
+        session = self.session
+        if session is not None and not session.closed:
+            return session
+        
+        async with self._session_lock:
+            if self.session is None or self.session.closed:
+                # The connector binds to the running loop, so it is built here rather than in __init__
+                # Resolve IPv4 only, via aiodns when installed instead of the threaded getaddrinfo
+                connector = aiohttp.TCPConnector(
+                    resolver=aiohttp.AsyncResolver() if HAS_AIODNS else None,
+                    family=socket.AF_INET,
+                    limit=CONNECTION_LIMIT,
+                    limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                    ttl_dns_cache=DNS_CACHE_TTL,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT
+                )
+                self.session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=self._timeout,
+                    raise_for_status=False,
+                    cookie_jar=aiohttp.DummyCookieJar()
+                )
+                self.session_loop = asyncio.get_running_loop()
+            return self.session
     
     async def close(self):
-        """Close the HTTP session."""
+        """Wait briefly for in-flight fetches, then close the HTTP session."""
+        inflight = [task for task in self._inflight.values() if task.get_loop() is asyncio.get_running_loop()]
+        if inflight:
+            log.info(f"{self.log_identifier} Waiting for {len(inflight)} in-flight requests")
+            _, pending = await asyncio.wait(inflight, timeout=CLOSE_INFLIGHT_TIMEOUT)
+            if pending:
+                log.warning(f"{self.log_identifier} {len(pending)} requests still in flight at close")
+        
         if self.session and not self.session.closed:
             await self.session.close()
             log.info(f"{self.log_identifier} HTTP session closed")
     
+    def _cache_get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Return a cached response if present and not expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return value
+    
+    async def _cached(
+        self,
+        key: Tuple,
+        ttl: float,
+        coro_factory: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Return a cached response for key, fetching it with coro_factory on a miss.
+        
+        Each caller gets its own copy, so mutating a result can't corrupt the cache.
+        Concurrent misses for the same key share one in-flight upstream fetch,
+        including its failure. The fetch runs in its own task, so cancelling any
+        caller (including the one that started it) leaves the others unaffected.
+        """
+        cached = self._cache_get(key)
+        if cached is not None:
+            return _copy_response(cached)
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache(key, ttl, coro_factory))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._inflight_done(key, done))
+        
+        # Shield so a cancelled caller doesn't cancel the shared fetch
+        return _copy_response(await asyncio.shield(task))
+    
+    async def _fetch_and_cache(
+        self,
+        key: Tuple,
+        ttl: float,
+        coro_factory: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Run an upstream fetch and store its result in the cache."""
+        result = await coro_factory()
+        # Jitter the TTL so entries fetched together don't expire together
+        self._cache[key] = (time.monotonic() + ttl * random.uniform(0.9, 1.1), result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        return result
+    
+    def _inflight_done(self, key: Tuple, task: "asyncio.Task[Dict[str, Any]]") -> None:
+        """Drop a finished fetch from the in-flight map."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved so asyncio doesn't warn when every caller was cancelled
+            task.exception()
+    
+    def _decode(self, decoder: msgspec.json.Decoder, body: bytes) -> Any:
+        """Decode a successful response body into its typed model."""
+        try:
+            return decoder.decode(body)
+        except msgspec.DecodeError as e:
+            # DecodeError (and ValidationError) subclass ValueError, which callers treat as a bad location
+            raise Exception(f"Unexpected weather API response: {e}") from e
+    
+    async def _read_error_message(self, response: aiohttp.ClientResponse) -> str:
+        """Read an error response body in full and extract the API's message."""
+        # Reading the whole body lets aiohttp reuse the connection instead of closing it
+        body = await response.read()
+        try:
+            return orjson.loads(body).get('message', 'Unknown error')
+        except (orjson.JSONDecodeError, AttributeError):
+            return 'Unknown error'
+    
     async def get_current_weather(self, location: str, units: str = "metric") -> Dict[str, Any]:
         """
         Get current weather for a location.
@@ -40,27 +201,36 @@ class WeatherService:
         Returns:
             Dictionary containing current weather data
         """
+        self.request_count += 1
+        key = ("weather", location.casefold(), units, None)
+        return await self._cached(
+            key, CURRENT_WEATHER_TTL, lambda: self._fetch_current_weather(location, units)
+        )
+    
+    async def _fetch_current_weather(self, location: str, units: str) -> Dict[str, Any]:
+        """Fetch current weather from the API, bypassing the cache."""
         log.info(f"{self.log_identifier} Fetching current weather for: {location}")
         
         session = await self._get_session()
-        url = f"{self.base_url}/weather"
-        params = {
-            "q": location,
-            "appid": self.api_key,
-            "units": units
-        }
+        params = (
+            ("q", location),
+            ("appid", self.api_key),
+            ("units", units)
+        )
         
         try:
-            async with session.get(url, params=params) as response:
+            async with session.get(self._weather_url, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = self._decode(self._weather_decoder, await response.read())
                     log.info(f"{self.log_identifier} Successfully fetched weather for {location}")
                     return self._format_current_weather(data)
                 elif response.status == 404:
+                    # Drain the body so the connection goes back to the pool
+                    await response.read()
                     raise ValueError(f"Location '{location}' not found")
                 else:
-                    error_data = await response.json()
-                    raise Exception(f"Weather API error: {error_data.get('message', 'Unknown error')}")
+                    message = await self._read_error_message(response)
+                    raise Exception(f"Weather API error: {message}")
         
         except aiohttp.ClientError as e:
             log.error(f"{self.log_identifier} Network error fetching weather: {e}")
@@ -78,95 +248,107 @@ class WeatherService:
         Returns:
             Dictionary containing forecast data
         """
+        self.request_count += 1
+        key = ("forecast", location.casefold(), units, days)
+        return await self._cached(
+            key, FORECAST_TTL, lambda: self._fetch_weather_forecast(location, days, units)
+        )
+    
+    async def _fetch_weather_forecast(self, location: str, days: int, units: str) -> Dict[str, Any]:
+        """Fetch a weather forecast from the API, bypassing the cache."""
         log.info(f"{self.log_identifier} Fetching {days}-day forecast for: {location}")
         
         session = await self._get_session()
-        url = f"{self.base_url}/forecast"
-        params = {
-            "q": location,
-            "appid": self.api_key,
-            "units": units,
-            "cnt": min(days * 8, 40)  # API returns 3-hour intervals, max 40 entries
-        }
+        params = (
+            ("q", location),
+            ("appid", self.api_key),
+            ("units", units),
+            ("cnt", min(days * 8, 40))  # API returns 3-hour intervals, max 40 entries
+        )
         
         try:
-            async with session.get(url, params=params) as response:
+            async with session.get(self._forecast_url, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = self._decode(self._forecast_decoder, await response.read())
                     log.info(f"{self.log_identifier} Successfully fetched forecast for {location}")
                     return self._format_forecast_data(data, days)
                 elif response.status == 404:
+                    # Drain the body so the connection goes back to the pool
+                    await response.read()
                     raise ValueError(f"Location '{location}' not found")
                 else:
-                    error_data = await response.json()
-                    raise Exception(f"Weather API error: {error_data.get('message', 'Unknown error')}")
+                    message = await self._read_error_message(response)
+                    raise Exception(f"Weather API error: {message}")
         
         except aiohttp.ClientError as e:
             log.error(f"{self.log_identifier} Network error fetching forecast: {e}")
             raise Exception(f"Network error: {str(e)}")
     
-    def _format_current_weather(self, data: Dict) -> Dict[str, Any]:
+    def _format_current_weather(self, data: CurrentWeatherResponse) -> Dict[str, Any]:
         """Format current weather data for consistent output."""
+        main = data.main
+        sys_info = data.sys
+        wind = data.wind
         return {
-            "location": f"{data['name']}, {data['sys']['country']}",
-            "temperature": data['main']['temp'],
-            "feels_like": data['main']['feels_like'],
-            "humidity": data['main']['humidity'],
-            "pressure": data['main']['pressure'],
-            "description": data['weather'][0]['description'].title(),
-            "wind_speed": data.get('wind', {}).get('speed', 0),
-            "wind_direction": data.get('wind', {}).get('deg', 0),
-            "visibility": data.get('visibility', 0) / 1000,  # Convert to km
-            "timestamp": datetime.fromtimestamp(data['dt']).isoformat(),
-            "sunrise": datetime.fromtimestamp(data['sys']['sunrise']).isoformat(),
-            "sunset": datetime.fromtimestamp(data['sys']['sunset']).isoformat()
+            "location": f"{data.name}, {sys_info.country}",
+            "temperature": main.temp,
+            "feels_like": main.feels_like,
+            "humidity": main.humidity,
+            "pressure": main.pressure,
+            "description": data.weather[0].description.title(),
+            "wind_speed": wind.speed if wind else 0,
+            "wind_direction": wind.deg if wind else 0,
+            "visibility": data.visibility / 1000,  # Convert to km
+            "timestamp": datetime.fromtimestamp(data.dt, tz=timezone.utc).isoformat(),
+            "sunrise": datetime.fromtimestamp(sys_info.sunrise, tz=timezone.utc).isoformat(),
+            "sunset": datetime.fromtimestamp(sys_info.sunset, tz=timezone.utc).isoformat()
         }
     
-    def _format_forecast_data(self, data: Dict, days: int) -> Dict[str, Any]:
+    def _format_forecast_data(self, data: ForecastResponse, days: int) -> Dict[str, Any]:
         """Format forecast data for consistent output."""
-        forecasts = []
-        current_date = None
-        daily_data = []
-        
-        for item in data['list'][:days * 8]:
-            forecast_date = datetime.fromtimestamp(item['dt']).date()
-            
-            if current_date != forecast_date:
-                if daily_data:
-                    forecasts.append(self._aggregate_daily_forecast(daily_data))
-                current_date = forecast_date
-                daily_data = []
-            
-            daily_data.append(item)
-        
-        # Add the last day's data
-        if daily_data:
-            forecasts.append(self._aggregate_daily_forecast(daily_data))
+        # Bucket entries by calendar day at the forecast location using integer
+        # arithmetic on the epoch timestamp; the list is already time-sorted.
+        tz_offset = data.city.timezone
+        forecasts = [
+            self._aggregate_daily_forecast(daily_data, day, tz_offset)
+            for day, daily_data in groupby(
+                data.items[:days * 8],
+                key=lambda item: (item.dt + tz_offset) // SECONDS_PER_DAY
+            )
+        ]
         
         return {
-            "location": f"{data['city']['name']}, {data['city']['country']}",
+            "location": f"{data.city.name}, {data.city.country}",
             "forecasts": forecasts[:days]
         }
     
-    def _aggregate_daily_forecast(self, daily_data: List[Dict]) -> Dict[str, Any]:
+    def _aggregate_daily_forecast(self, daily_data: Iterable[ForecastItem], day: int, tz_offset: int = 0) -> Dict[str, Any]:
         """Aggregate 3-hour forecasts into daily summary."""
-        if not daily_data:
-            return {}
+        # Track min/max temperature and the forecast closest to noon in one pass
+        temp_min = math.inf
+        temp_max = -math.inf
+        noon_forecast = None
+        noon_distance = 99
+        for item in daily_data:
+            temp = item.main.temp
+            if temp < temp_min:
+                temp_min = temp
+            if temp > temp_max:
+                temp_max = temp
+            distance = abs(((item.dt + tz_offset) % SECONDS_PER_DAY) // 3600 - 12)
+            if distance < noon_distance:
+                noon_distance = distance
+                noon_forecast = item
         
-        # Get temperatures for min/max calculation
-        temps = [item['main']['temp'] for item in daily_data]
-        
-        # Use the forecast closest to noon for general conditions
-        noon_forecast = min(daily_data, key=lambda x: abs(
-            datetime.fromtimestamp(x['dt']).hour - 12
-        ))
+        if noon_forecast is None:
+            return {}
         
         return {
-            "date": datetime.fromtimestamp(daily_data[0]['dt']).date().isoformat(),
-            "temperature_min": min(temps),
-            "temperature_max": max(temps),
-            "description": noon_forecast['weather'][0]['description'].title(),
-            "humidity": noon_forecast['main']['humidity'],
-            "wind_speed": noon_forecast.get('wind', {}).get('speed', 0),
-            "precipitation_probability": noon_forecast.get('pop', 0) * 100
-        }
\ No newline at end of file
+            "date": datetime.fromtimestamp(day * SECONDS_PER_DAY, tz=timezone.utc).date().isoformat(),
+            "temperature_min": temp_min,
+            "temperature_max": temp_max,
+            "description": noon_forecast.weather[0].description.title(),
+            "humidity": noon_forecast.main.humidity,
+            "wind_speed": noon_forecast.wind.speed if noon_forecast.wind else 0,
+            "precipitation_probability": noon_forecast.pop * 100
+        }
@@ -2,13 +2,25 @@
 Weather agent tools for fetching and processing weather data.
 """
 
-import json
+import asyncio
+import orjson
 from typing import Any, Dict, Optional
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from google.adk.tools import ToolContext
 from solace_ai_connector.common.log import log
 from solace_agent_mesh.agent.utils.artifact_helpers import save_artifact_with_metadata
 
+# Default validity windows (seconds) advertised on saved artifacts
+CURRENT_ARTIFACT_TTL = 600
+FORECAST_ARTIFACT_TTL = 10800
+
+# English names for forecast dates, avoiding locale-dependent strftime
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December"
+)
+
 async def get_current_weather(
     location: str,
     units: str = "metric",
@@ -38,17 +50,7 @@ async def get_current_weather(
     
     try:
         # Get weather service from agent state
-        host_component = getattr(tool_context._invocation_context, "agent", None)
-        if host_component:
-            host_component = getattr(host_component, "host_component", None)
-        
-        if not host_component:
-            return {
-                "status": "error",
-                "message": "Could not access agent host component"
-            }
-        
-        weather_service = host_component.get_agent_specific_state("weather_service")
+        weather_service = _resolve_weather_service(tool_context)
         if not weather_service:
             return {
                 "status": "error",
@@ -71,7 +73,8 @@ async def get_current_weather(
         # Save to artifact if requested
         if save_to_file:
             artifact_result = await _save_weather_artifact(
-                weather_data, f"current_weather_{location}", tool_context
+                weather_data, f"current_weather_{location}", tool_context,
+                ttl_seconds=_artifact_ttl(tool_config, "current_artifact_ttl_seconds", CURRENT_ARTIFACT_TTL)
             )
             result["artifact"] = artifact_result
         
@@ -130,17 +133,7 @@ async def get_weather_forecast(
     
     try:
         # Get weather service from agent state
-        host_component = getattr(tool_context._invocation_context, "agent", None)
-        if host_component:
-            host_component = getattr(host_component, "host_component", None)
-        
-        if not host_component:
-            return {
-                "status": "error",
-                "message": "Could not access agent host component"
-            }
-        
-        weather_service = host_component.get_agent_specific_state("weather_service")
+        weather_service = _resolve_weather_service(tool_context)
         if not weather_service:
             return {
                 "status": "error",
@@ -163,7 +156,8 @@ async def get_weather_forecast(
         # Save to artifact if requested
         if save_to_file:
             artifact_result = await _save_weather_artifact(
-                forecast_data, f"forecast_{location}_{days}day", tool_context
+                forecast_data, f"forecast_{location}_{days}day", tool_context,
+                ttl_seconds=_artifact_ttl(tool_config, "forecast_artifact_ttl_seconds", FORECAST_ARTIFACT_TTL)
             )
             result["artifact"] = artifact_result
         
@@ -184,44 +178,212 @@ async def get_weather_forecast(
         }
 
 
+async def get_weather_bundle(
+    location: str,
+    days: int = 5,
+    units: str = "metric",
+    save_to_file: bool = False,
+    tool_context: Optional[ToolContext] = None,
+    tool_config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Get current weather conditions and a forecast for a specified location in one call.
+    
+    Args:
+        location: City name, state, and country
+        days: Number of days for forecast (1-5)
+        units: Temperature units
+        save_to_file: Whether to save the combined report as an artifact
+    
+    Returns:
+        Dictionary containing current weather and forecast information
+    """
+    log_identifier = "[GetWeatherBundle]"
+    log.info(f"{log_identifier} Getting current weather and {days}-day forecast for: {location}")
+    
+    if not tool_context:
+        return {
+            "status": "error",
+            "message": "Tool context is required for weather operations"
+        }
+    
+    # Validate days parameter
+    if not 1 <= days <= 5:
+        return {
+            "status": "error",
+            "message": "Days must be between 1 and 5"
+        }
+    
+    try:
+        # Get weather service from agent state
+        weather_service = _resolve_weather_service(tool_context)
+        if not weather_service:
+            return {
+                "status": "error",
+                "message": "Weather service not initialized"
+            }
+        
+        # Fetch both concurrently; they share the service's connection pool
+        weather_data, forecast_data = await asyncio.gather(
+            weather_service.get_current_weather(location, units),
+            weather_service.get_weather_forecast(location, days, units),
+            return_exceptions=True
+        )
+        
+        # Cancellation is a BaseException, not an Exception; propagate it
+        for outcome in (weather_data, forecast_data):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+        
+        current_failed = isinstance(weather_data, BaseException)
+        forecast_failed = isinstance(forecast_data, BaseException)
+        if current_failed and forecast_failed:
+            raise weather_data
+        
+        result = {
+            "status": "partial" if current_failed or forecast_failed else "success",
+            "location": (forecast_data if current_failed else weather_data)["location"]
+        }
+        summaries = []
+        errors = {}
+        
+        if current_failed:
+            log.warning(f"{log_identifier} Current weather failed for {location}: {weather_data}")
+            errors["current"] = str(weather_data)
+        else:
+            summaries.append(_create_weather_summary(weather_data))
+            result["current"] = weather_data
+        
+        if forecast_failed:
+            log.warning(f"{log_identifier} Forecast failed for {location}: {forecast_data}")
+            errors["forecast"] = str(forecast_data)
+        else:
+            summaries.append(_create_forecast_summary(forecast_data))
+            result["forecast"] = forecast_data
+        
+        result["summary"] = "\n\n".join(summaries)
+        if errors:
+            result["errors"] = errors
+        
+        # Save to artifact if requested
+        if save_to_file:
+            bundle_data = {
+                "location": result["location"],
+                "current": result.get("current"),
+                "forecast": result.get("forecast")
+            }
+            artifact_result = await _save_weather_artifact(
+                bundle_data, f"weather_bundle_{location}_{days}day", tool_context,
+                # The bundle is only as fresh as its current conditions
+                ttl_seconds=_artifact_ttl(tool_config, "current_artifact_ttl_seconds", CURRENT_ARTIFACT_TTL)
+            )
+            result["artifact"] = artifact_result
+        
+        log.info(f"{log_identifier} Successfully retrieved weather bundle for {location}")
+        return result
+    
+    except ValueError as e:
+        log.warning(f"{log_identifier} Invalid location: {e}")
+        return {
+            "status": "error",
+            "message": f"Location error: {str(e)}"
+        }
+    except Exception as e:
+        log.error(f"{log_identifier} Error getting weather bundle: {e}")
+        return {
+            "status": "error",
+            "message": f"Weather service error: {str(e)}"
+        }
+
+
+def _resolve_weather_service(tool_context: ToolContext) -> Optional[Any]:
+    """
+    Look up the weather service from the agent host component.
+    
+    The result is memoized on the invocation context so repeated tool calls
+    within one invocation skip the lookup.
+    """
+    invocation_context = tool_context._invocation_context
+    weather_service = getattr(invocation_context, "_cached_weather_service", None)
+    if weather_service is not None:
+        return weather_service
+    
+    agent = getattr(invocation_context, "agent", None)
+    host_component = getattr(agent, "host_component", None) if agent else None
+    if not host_component:
+        log.warning("[WeatherTools] Could not access agent host component")
+        return None
+    
+    weather_service = host_component.get_agent_specific_state("weather_service")
+    if weather_service is not None:
+        try:
+            invocation_context._cached_weather_service = weather_service
+        except (AttributeError, ValueError):
+            pass
+    return weather_service
+
+
+def _artifact_ttl(tool_config: Optional[Dict[str, Any]], key: str, default: int) -> int:
+    """Read an artifact TTL override from tool_config, falling back to default."""
+    value = tool_config.get(key) if tool_config else None
+    if value is None:
+        return default
+    try:
+        ttl = int(value)
+    except (TypeError, ValueError):
+        ttl = -1
+    if ttl < 0:
+        log.warning(f"[WeatherTools] Invalid {key} {value!r} in tool_config, using {default}")
+        return default
+    return ttl
+
+
 def _create_weather_summary(weather_data: Dict[str, Any]) -> str:
     """Create a human-readable weather summary."""
     temp_unit = "°C"  # Assuming metric units for summary
     
-    summary = f"Current weather in {weather_data['location']}:\n"
-    summary += f"• Temperature: {weather_data['temperature']}{temp_unit} (feels like {weather_data['feels_like']}{temp_unit})\n"
-    summary += f"• Conditions: {weather_data['description']}\n"
-    summary += f"• Humidity: {weather_data['humidity']}%\n"
-    summary += f"• Wind: {weather_data['wind_speed']} m/s\n"
-    summary += f"• Visibility: {weather_data['visibility']} km"
+    parts = [
+        f"Current weather in {weather_data['location']}:\n",
+        f"• Temperature: {weather_data['temperature']}{temp_unit} (feels like {weather_data['feels_like']}{temp_unit})\n",
+        f"• Conditions: {weather_data['description']}\n",
+        f"• Humidity: {weather_data['humidity']}%\n",
+        f"• Wind: {weather_data['wind_speed']} m/s\n",
+        f"• Visibility: {weather_data['visibility']} km"
+    ]
     
-    return summary
+    return "".join(parts)
 
 
 def _create_forecast_summary(forecast_data: Dict[str, Any]) -> str:
     """Create a human-readable forecast summary."""
-    summary = f"Weather forecast for {forecast_data['location']}:\n\n"
+    parts = [f"Weather forecast for {forecast_data['location']}:\n\n"]
     
     for forecast in forecast_data['forecasts']:
-        date = datetime.fromisoformat(forecast['date']).strftime('%A, %B %d')
-        summary += f"• {date}: {forecast['description']}\n"
-        summary += f"  High: {forecast['temperature_max']:.1f}°C, Low: {forecast['temperature_min']:.1f}°C\n"
+        day = date.fromisoformat(forecast['date'])
+        label = f"{_WEEKDAYS[day.weekday()]}, {_MONTHS[day.month - 1]} {day.day:02d}"
+        parts.append(f"• {label}: {forecast['description']}\n")
+        parts.append(f"  High: {forecast['temperature_max']:.1f}°C, Low: {forecast['temperature_min']:.1f}°C\n")
         if forecast['precipitation_probability'] > 0:
-            summary += f"  Precipitation: {forecast['precipitation_probability']:.0f}% chance\n"
-        summary += "\n"
+            parts.append(f"  Precipitation: {forecast['precipitation_probability']:.0f}% chance\n")
+        parts.append("\n")
     
-    return summary.strip()
+    return "".join(parts).strip()
 
 
 async def _save_weather_artifact(
     weather_data: Dict[str, Any],
     filename_base: str,
-    tool_context: ToolContext
+    tool_context: ToolContext,
+    ttl_seconds: int = CURRENT_ARTIFACT_TTL
 ) -> Dict[str, Any]:
-    """Save weather data as an artifact."""
+    """Save weather data as an artifact, tagged with how long it stays valid."""
     try:
-        # Prepare content
-        content = json.dumps(weather_data, indent=2, default=str)
+        # Prepare content (orjson returns bytes and handles datetimes natively)
+        content_bytes = orjson.dumps(
+            weather_data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
         timestamp = datetime.now(timezone.utc)
         filename = f"{filename_base}_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
         
@@ -233,11 +395,13 @@ async def _save_weather_artifact(
             user_id=tool_context._invocation_context.user_id,
             session_id=tool_context._invocation_context.session.id,
             filename=filename,
-            content_bytes=content.encode('utf-8'),
+            content_bytes=content_bytes,
             mime_type="application/json",
             metadata_dict={
                 "description": "Weather data report",
-                "source": "Weather Agent"
+                "source": "Weather Agent",
+                "cache_control": f"private, max-age={ttl_seconds}",
+                "expires": (timestamp + timedelta(seconds=ttl_seconds)).isoformat()
             },
             timestamp=timestamp
         )